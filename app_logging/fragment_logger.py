@@ -1,3 +1,23 @@
+import logging
+import re
+import threading
+
+# Case-insensitive matching avoids a lowercased copy of every yt-dlp line.
+# One scan classifies a warning; the group name says which trigger matched.
+_WARN_TRIGGERS = re.compile(
+    r"(?P<signature>signature solving failed|challenge solving failed)"
+    r"|(?P<images>only images are available)"
+    r"|(?P<fragment>fragment|skipping)",
+    re.IGNORECASE,
+)
+# Errors are searched per trigger: the fragment pattern spans the whole line, so in a
+# single alternation it would swallow a format match sitting between its two halves
+_FORMAT_UNAVAILABLE_RE = re.compile(r"requested format is not available", re.IGNORECASE)
+_FRAGMENT_NOT_FOUND_RE = re.compile(
+    r"fragment.*not found|not found.*fragment", re.IGNORECASE | re.DOTALL
+)
+
+
 class FatalForbiddenError(Exception):
     """Custom exception to stop the script immediately on 403 errors."""
 
@@ -11,11 +31,19 @@ class FragmentLogger:
     """
 
     def __init__(self) -> None:
+        # One logger is shared by the parallel downloads of a group
+        self._lock = threading.Lock()
         self.skipped = 0
         self.errors = 0
         self.warnings = 0
         self.signature_solving_failed = False
         self.only_images_available = False
+        log = self._log()
+        self._debug_enabled = log is not None and log.isEnabledFor(logging.DEBUG)
+
+    def _bump(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
 
     def _log(self):
         from . import log
@@ -23,35 +51,41 @@ class FragmentLogger:
         return log
 
     def debug(self, msg: str) -> None:
-        if "fragment" in msg.lower() and "skipping" in msg.lower():
-            self.skipped += 1
+        # yt-dlp reports "[download] Skipping fragment N ..." in a fixed case
+        if "fragment" in msg and ("Skipping" in msg or "skipping" in msg):
+            self._bump("skipped")
+            if self._debug_enabled:
+                self._log().debug("Skipped fragment: %s", msg)
 
     def info(self, msg: str) -> None:
         pass
 
     def warning(self, msg: str) -> None:
+        kinds = {m.lastgroup for m in _WARN_TRIGGERS.finditer(msg)}
+        if not kinds:
+            self._bump("warnings")
+            return
+
         log = self._log()
-        msg_lower = msg.lower()
 
         # Detect signature solving failures
-        if "signature solving failed" in msg_lower or "challenge solving failed" in msg_lower:
+        if "signature" in kinds:
             self.signature_solving_failed = True
-            log.warning(f"Signature solving issue detected: {msg}")
+            log.warning("Signature solving issue detected: %s", msg)
 
         # Detect "only images available" warnings
-        if "only images are available" in msg_lower:
+        if "images" in kinds:
             self.only_images_available = True
             log.warning("Only storyboard images available - no audio/video formats")
 
-        if "fragment" in msg_lower or "skipping" in msg_lower:
-            self.skipped += 1
-            log.warning(f"Skipped Fragment: {msg}")
+        if "fragment" in kinds:
+            self._bump("skipped")
+            log.warning("Skipped Fragment: %s", msg)
         else:
-            self.warnings += 1
+            self._bump("warnings")
 
     def error(self, msg: str) -> None:
         log = self._log()
-        msg_lower = msg.lower()
 
         if "403" in msg or "Forbidden" in msg:
             error_msg = "HTTP Error 403 Detected! YouTube blocked the connection."
@@ -60,12 +94,12 @@ class FragmentLogger:
             raise FatalForbiddenError("403 Forbidden")
 
         # Detect format availability issues
-        if "requested format is not available" in msg_lower:
+        if _FORMAT_UNAVAILABLE_RE.search(msg):
             # Check if this is due to signature solving failure
             if self.signature_solving_failed or self.only_images_available:
                 log.warning("Format unavailable likely due to signature solving failure")
 
         log.error(msg)
-        self.errors += 1
-        if "fragment" in msg_lower and "not found" in msg_lower:
-            self.skipped += 1
+        self._bump("errors")
+        if _FRAGMENT_NOT_FOUND_RE.search(msg):
+            self._bump("skipped")
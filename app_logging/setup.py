@@ -1,4 +1,5 @@
 import logging
+import os
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from pathlib import Path
 from typing import Optional
@@ -15,19 +16,59 @@ from config.constants import (
 _LEVEL_NAMES = {"DEBUG": logging.DEBUG, "INFO": logging.INFO, "WARNING": logging.WARNING, "ERROR": logging.ERROR}
 
 
+class _SharedMessageFormatter(logging.Formatter):
+    """Interpolates msg % args once per record, so every handler reuses the result."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return super().format(record)
+
+
+def _is_rollable(path: str) -> bool:
+    # Never rollover anything other than regular files (bpo-45401)
+    return not os.path.exists(path) or os.path.isfile(path)
+
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that stats the log file only when a rollover is due."""
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        pos = self.stream.tell()
+        if not pos:
+            return False
+        msg = "%s\n" % self.format(record)
+        if pos + len(msg) < self.maxBytes:
+            return False
+        return _is_rollable(self.baseFilename)
+
+
 def setup_logging(base_dir: Path, console_level: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger("MusicDownloader")
 
     if logger.hasHandlers():
         return logger
 
-    logger.setLevel(logging.DEBUG)
+    level = _LEVEL_NAMES.get((console_level or "INFO").upper(), logging.INFO)
+    # Without a DEBUG consumer, drop debug records before they are built
+    debug_file = (
+        level <= logging.DEBUG
+        or os.environ.get("DEBUG_LOGS") == "1"
+        or LOG_ROTATION_MODE not in ("size", "time")
+    )
+    file_level = logging.DEBUG if debug_file else logging.INFO
+    logger.setLevel(min(level, file_level))
     logs_dir = base_dir / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
     log_file_path = logs_dir / "log.txt"
 
     if LOG_ROTATION_MODE == "size":
-        file_handler = RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             log_file_path,
             maxBytes=LOG_FILE_MAX_BYTES,
             backupCount=LOG_FILE_BACKUP_COUNT,
@@ -44,16 +85,15 @@ def setup_logging(base_dir: Path, console_level: Optional[str] = None) -> loggin
     else:
         file_handler = logging.FileHandler(log_file_path, mode="w", encoding="utf-8")
 
-    file_handler.setLevel(logging.DEBUG)
-    file_format = logging.Formatter(
+    file_handler.setLevel(file_level)
+    file_format = _SharedMessageFormatter(
         "%(asctime)s - [%(levelname)s] - %(filename)s:%(lineno)d - %(message)s"
     )
     file_handler.setFormatter(file_format)
 
     console_handler = logging.StreamHandler()
-    level = _LEVEL_NAMES.get((console_level or "INFO").upper(), logging.INFO)
     console_handler.setLevel(level)
-    console_format = logging.Formatter("%(message)s")
+    console_format = _SharedMessageFormatter("%(message)s")
     console_handler.setFormatter(console_format)
 
     logger.addHandler(file_handler)
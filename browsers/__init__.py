@@ -1,5 +1,5 @@
-from .base import BrowserBackend
+from .base import BrowserBackend, extract_all
 from .chrome import ChromeBrowser
 from .firefox import FirefoxBrowser
 
-__all__ = ["BrowserBackend", "FirefoxBrowser", "ChromeBrowser"]
+__all__ = ["BrowserBackend", "FirefoxBrowser", "ChromeBrowser", "extract_all"]
@@ -1,19 +1,116 @@
 import json
 import os
 import re
-import shutil
-import tempfile
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import lz4.block
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+
+    def _json_loads(data: Any) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (lone surrogates in truncated titles, 1e400);
+            # such files still parsed before orjson was added
+            return json.loads(data)
+
+except ImportError:
+    _json_loads = json.loads
+
+_VID_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:[^&#]*&)*?v=|shorts/)|youtu\.be/)([^?&/#]+)"
+)
+_REJECT_RE = re.compile(r"search_query=|/results|accounts\.google|google\.com/settings")
+_BARE_YT_RE = re.compile(r"(?:https?://)?(?:www\.)?youtube\.com/*")
+# Host check anchored at the start: other sites merely mentioning YouTube bail out early
+_YT_HOST_RE = re.compile(r"(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)(?:[/?#]|$)")
+_VIDEO_PATH_RE = re.compile(r"/watch|/shorts/|youtu\.be")
+
+# CreateFileW flags for reading files the browser still holds open (Windows)
+_GENERIC_READ = 0x80000000
+_FILE_SHARE_ALL = 0x00000001 | 0x00000002 | 0x00000004  # READ | WRITE | DELETE
+_OPEN_EXISTING = 3
+_FILE_ATTRIBUTE_NORMAL = 0x80
+
+
+def _read_shared(path: Path) -> bytes:
+    """Reads a whole file without blocking (or being blocked by) the browser."""
+    if os.name != "nt":
+        with open(path, "rb") as f:
+            return f.read()
+
+    import ctypes
+    import msvcrt
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    create_file = kernel32.CreateFileW
+    create_file.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.LPVOID,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.HANDLE,
+    ]
+    create_file.restype = wintypes.HANDLE
+
+    handle = create_file(
+        str(path),
+        _GENERIC_READ,
+        _FILE_SHARE_ALL,
+        None,
+        _OPEN_EXISTING,
+        _FILE_ATTRIBUTE_NORMAL,
+        None,
+    )
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    fd = msvcrt.open_osfhandle(handle, os.O_RDONLY)
+    with os.fdopen(fd, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=4096)
+def extract_video_id(url: str) -> Optional[str]:
+    """Shared utility to extract video ID from URL (interned, shared across sources)."""
+    match = _VID_RE.search(url)
+    return sys.intern(match.group(1)) if match else None
+
+
+@lru_cache(maxsize=4096)
+def is_youtube_video(url: str) -> bool:
+    """Shared utility to check if a URL is a valid video (not search/home)."""
+    if not url:
+        return False
+
+    if not _YT_HOST_RE.match(url):
+        return False
+
+    if _REJECT_RE.search(url):
+        return False
+
+    if _BARE_YT_RE.fullmatch(url):
+        return False
+
+    return _VIDEO_PATH_RE.search(url) is not None
 
 
 class BrowserBackend(ABC):
     """
     Abstract base class for adding future browsers (Edge, Brave, Opera, etc).
+    Subclasses may satisfy `name` with a plain class attribute.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -31,78 +128,83 @@ class BrowserBackend(ABC):
         """
         pass
 
-    def _extract_video_id(self, url: str) -> Optional[str]:
-        """Shared utility to extract video ID from URL."""
-        if "youtube.com/watch" in url:
-            match = re.search(r"[?&]v=([^&]+)", url)
-            return match.group(1) if match else None
-        elif "youtu.be/" in url:
-            return url.split("youtu.be/")[1].split("?")[0]
-        elif "youtube.com/shorts/" in url:
-            return url.split("shorts/")[1].split("?")[0]
-        return None
-
-    def _is_youtube_video(self, url: str) -> bool:
-        """Shared utility to check if a URL is a valid video (not search/home)."""
-        if not url:
-            return False
-
-        if "youtube.com" not in url and "youtu.be" not in url:
-            return False
-
-        if any(
-            x in url
-            for x in [
-                "search_query=",
-                "/results",
-                "accounts.google",
-                "google.com/settings",
-            ]
-        ):
-            return False
-
-        clean_check = url.replace("www.", "").replace("https://", "").strip("/")
-        if clean_check == "youtube.com":
-            return False
-
-        if "/watch" in url or "/shorts/" in url or "youtu.be" in url:
-            return True
+    def source_files(self, profile_path: Path) -> List[Path]:
+        """Files/folders extract_groups reads; an empty list means results are never cached."""
+        return []
 
-        return False
+    def source_fingerprint(self, profile_path: Path) -> Optional[Tuple[Optional[int], ...]]:
+        """
+        mtimes (ns) of source_files, or None if the backend declares none.
+        Equal fingerprints mean extract_groups would return the same groups.
+        """
+        paths = self.source_files(profile_path)
+        if not paths:
+            return None
+        stamps = []
+        for path in paths:
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    # Same URLs recur across sessions, backups and bookmark folders
+    _extract_video_id = staticmethod(extract_video_id)
+    _is_youtube_video = staticmethod(is_youtube_video)
 
     def _safe_read_json(self, path: Path) -> Optional[Dict[str, Any]]:
-        """Copies a file to temp storage before reading to avoid lock errors."""
+        """Reads a (possibly mozLz4-compressed) JSON file opened in shared mode."""
         from app_logging import log
 
         if not path.exists():
             return None
 
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            temp_path = Path(tmp.name)
-
         try:
-            shutil.copy2(path, temp_path)
-            with open(temp_path, "rb") as f:
-                content = f.read()
-
-            if content.startswith(b"mozLz40"):
-                try:
-                    decompressed = lz4.block.decompress(content[8:])
-                    return json.loads(decompressed)
-                except Exception as e:
-                    log.debug(f"LZ4 Decompression failed: {e}")
-                    return None
-            else:
-                try:
-                    return json.loads(content.decode("utf-8"))
-                except Exception:
-                    return None
+            content = _read_shared(path)
         except Exception as e:
-            log.warning(f"Safe read failed for {path}: {e}")
+            log.warning("Safe read failed for %s: %s", path, e)
             return None
-        finally:
-            if temp_path.exists():
-                try:
-                    os.unlink(temp_path)
-                except OSError:
-                    pass
+
+        if content.startswith(b"mozLz40"):
+            # Only Firefox profiles need lz4; Chrome-only runs never import it
+            import lz4.block
+
+            try:
+                # Bytes 8..12 hold the decompressed size, which lz4 reads itself
+                decompressed = lz4.block.decompress(memoryview(content)[8:])
+                return _json_loads(decompressed)
+            except Exception as e:
+                log.debug("LZ4 Decompression failed: %s", e)
+                return None
+        else:
+            try:
+                return _json_loads(content)
+            except Exception:
+                return None
+
+
+def extract_all(
+    jobs: Iterable[Tuple[BrowserBackend, Path]],
+) -> Dict[Tuple[BrowserBackend, Path], Dict[str, List[str]]]:
+    """
+    Runs extract_groups for several (backend, profile) pairs concurrently.
+    File reads and LZ4 decompression release the GIL and overlap across profiles;
+    JSON parsing (orjson or json) holds it and runs one profile at a time.
+    """
+    from app_logging import log
+
+    jobs = list(jobs)
+    if not jobs:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as ex:
+        futures = {ex.submit(b.extract_groups, p): (b, p) for b, p in jobs}
+        for future in as_completed(futures):
+            backend, profile = futures[future]
+            try:
+                results[(backend, profile)] = future.result()
+            except Exception as e:
+                log.warning("Failed to read %s profile %s: %s", backend.name, profile, e)
+                results[(backend, profile)] = {}
+    return results
@@ -2,14 +2,21 @@ import os
 import re
 import platform
 from pathlib import Path
-from typing import Dict, List
-from .base import BrowserBackend
+from typing import Dict, List, Optional
+from .base import BrowserBackend, _read_shared
+
+_SESSION_URL_RE = re.compile(rb'(https?://[^\x00-\x20\x7f"<>|\^`{\}]+)')
+# How far before a b"youtu" hit the URL's scheme may start ("https://music." fits easily)
+_URL_LOOKBEHIND = 256
+_CHROME_SPECIAL_FOLDERS = frozenset(
+    {"Bookmarks bar", "Other bookmarks", "Mobile bookmarks"}
+)
 
 
 class ChromeBrowser(BrowserBackend):
-    @property
-    def name(self) -> str:
-        return "Google Chrome"
+    __slots__ = ()
+
+    name = "Google Chrome"
 
     def get_profiles(self) -> List[Path]:
         system = platform.system()
@@ -25,19 +32,50 @@ class ChromeBrowser(BrowserBackend):
         elif system == "Linux":
             base_path = Path.home() / ".config" / "google-chrome"
 
-        if not base_path or not base_path.exists():
+        if not base_path:
             return []
 
-        profiles = []
-        if (base_path / "Default").exists():
-            profiles.append(base_path / "Default")
-        profiles.extend(list(base_path.glob("Profile *")))
+        entries = []
+        try:
+            it = os.scandir(base_path)
+        except OSError:
+            return []
+        with it:
+            for e in it:
+                if (
+                    e.name == "Default" or e.name.startswith("Profile ")
+                ) and e.is_dir(follow_symlinks=False):
+                    try:
+                        pref_mtime = os.stat(os.path.join(e.path, "Preferences")).st_mtime
+                    except OSError:
+                        pref_mtime = 0
+                    entries.append((pref_mtime, e.name != "Default", e.path))
 
-        def get_pref_mtime(p):
-            pref = p / "Preferences"
-            return pref.stat().st_mtime if pref.exists() else 0
+        entries.sort(key=lambda entry: (-entry[0], entry[1]))
+        return [Path(path) for _, _, path in entries]
 
-        return sorted(profiles, key=get_pref_mtime, reverse=True)
+    def _session_file(self, profile_path: Path) -> Optional[Path]:
+        """'Current Session' if it has data, else the newest Session_* file."""
+        # One listing; DirEntry.stat() is free on Windows and cached elsewhere
+        try:
+            it = os.scandir(profile_path / "Sessions")
+        except OSError:
+            return None
+
+        current = None
+        newest = None
+        with it:
+            for e in it:
+                if e.name == "Current Session":
+                    current = e
+                elif e.name.startswith("Session_"):
+                    mtime = e.stat().st_mtime
+                    if newest is None or mtime > newest[0]:
+                        newest = (mtime, e.path)
+
+        if current is not None and current.stat().st_size:
+            return Path(current.path)
+        return Path(newest[1]) if newest else None
 
     def _get_active_session_urls(self, profile_path: Path) -> List[str]:
         """
@@ -46,45 +84,57 @@ class ChromeBrowser(BrowserBackend):
         """
         from app_logging import log
 
-        sessions_dir = profile_path / "Sessions"
-        if not sessions_dir.exists():
+        target_file = self._session_file(profile_path)
+        if target_file is None:
             return []
 
-        target_file = sessions_dir / "Current Session"
-
-        if not target_file.exists() or target_file.stat().st_size == 0:
-            session_files = list(sessions_dir.glob("Session_*"))
-            if session_files:
-                target_file = max(session_files, key=os.path.getmtime)
-            else:
-                return []
-
         final_urls = []
         seen_video_ids = set()
-        url_pattern = re.compile(rb'(https?://[^\x00-\x20\x7f"<>|\^`{\}]+)')
 
         try:
-            with open(target_file, "rb") as f:
-                content = f.read()
-                matches = url_pattern.findall(content)
-
-                for match in reversed(matches):
-                    try:
-                        dec_url = match.decode("utf-8")
-
-                        if self._is_youtube_video(dec_url):
-                            vid_id = self._extract_video_id(dec_url)
-                            if vid_id and vid_id not in seen_video_ids:
-                                seen_video_ids.add(vid_id)
-                                final_urls.append(dec_url)
-
-                    except UnicodeDecodeError:
-                        continue
+            # Shared-mode read: Chrome keeps appending to this file, and a mapping
+            # (or a non-sharing open) would block it on Windows. An empty file finds nothing.
+            data = _read_shared(target_file)
+            # Walk b"youtu" hits and match the URL around each one; the rest of the
+            # file (other sites, tab state) is never touched by the regex
+            spans = []
+            pos = data.find(b"youtu")
+            while pos >= 0:
+                start = data.rfind(b"http", max(0, pos - _URL_LOOKBEHIND), pos)
+                m = _SESSION_URL_RE.match(data, start) if start >= 0 else None
+                if m and m.end() > pos:
+                    spans.append(m.span())
+                    pos = m.end()
+                else:
+                    pos += 5
+                pos = data.find(b"youtu", pos)
+
+            for start, end in reversed(spans):
+                raw = data[start:end]
+                try:
+                    dec_url = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    continue
+
+                if self._is_youtube_video(dec_url):
+                    vid_id = self._extract_video_id(dec_url)
+                    if vid_id and vid_id not in seen_video_ids:
+                        seen_video_ids.add(vid_id)
+                        final_urls.append(dec_url)
         except Exception as e:
-            log.warning(f"Could not read Chrome Session file: {e}")
+            log.warning("Could not read Chrome Session file: %s", e)
 
         return final_urls
 
+    def source_files(self, profile_path: Path) -> List[Path]:
+        """The Sessions folder (new Session_* files), the session file in use and Bookmarks."""
+        files = [profile_path / "Sessions"]
+        session_file = self._session_file(profile_path)
+        if session_file is not None:
+            files.append(session_file)
+        files.append(profile_path / "Bookmarks")
+        return files
+
     def extract_groups(self, profile_path: Path) -> Dict[str, List[str]]:
         from app_logging import log
 
@@ -100,23 +150,25 @@ class ChromeBrowser(BrowserBackend):
         if data:
             try:
                 seen_bookmark_vids = set()
+                roots = data.get("roots", {})
+                # Depth-first, children pushed in reverse to keep bookmark order
+                stack = [(roots[k], None) for k in reversed(list(roots))]
 
-                def recurse_nodes(node, current_folder_name=None):
-                    my_name = node.get("name", "")
+                while stack:
+                    node, current_folder_name = stack.pop()
+                    if not isinstance(node, dict):
+                        continue
                     if "children" in node:
+                        my_name = node.get("name", "")
                         next_group = (
                             my_name
                             if node.get("id") != "0"
-                            and my_name
-                            not in [
-                                "Bookmarks bar",
-                                "Other bookmarks",
-                                "Mobile bookmarks",
-                            ]
+                            and my_name not in _CHROME_SPECIAL_FOLDERS
                             else current_folder_name
                         )
-                        for child in node["children"]:
-                            recurse_nodes(child, next_group)
+                        stack.extend(
+                            (child, next_group) for child in reversed(node["children"])
+                        )
                     elif "url" in node:
                         url = node["url"]
                         if self._is_youtube_video(url):
@@ -127,11 +179,7 @@ class ChromeBrowser(BrowserBackend):
                                     if current_folder_name not in organized_groups:
                                         organized_groups[current_folder_name] = []
                                     organized_groups[current_folder_name].append(url)
-
-                roots = data.get("roots", {})
-                for root_key in roots:
-                    recurse_nodes(roots[root_key])
             except Exception as e:
-                log.warning(f"Failed to parse Chrome bookmarks for {profile_path}: {e}")
+                log.warning("Failed to parse Chrome bookmarks for %s: %s", profile_path, e)
 
         return organized_groups
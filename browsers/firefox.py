@@ -1,14 +1,15 @@
 import os
 import platform
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List
 from .base import BrowserBackend
 
 
 class FirefoxBrowser(BrowserBackend):
-    @property
-    def name(self) -> str:
-        return "Mozilla Firefox"
+    __slots__ = ()
+
+    name = "Mozilla Firefox"
 
     def get_profiles(self) -> List[Path]:
         """Locates Firefox profiles (Standard, Snap, Flatpak)."""
@@ -37,27 +38,33 @@ class FirefoxBrowser(BrowserBackend):
                 / "firefox"
             )
 
-        valid_profiles = []
+        entries = []
         for base in potential_base_paths:
-            if base.exists():
-                valid_profiles.extend([p for p in base.glob("*.*") if p.is_dir()])
+            # Missing install locations are the common case; scandir reports them itself
+            try:
+                it = os.scandir(base)
+            except OSError:
+                continue
+            with it:
+                for e in it:
+                    if "." in e.name and e.is_dir():
+                        entries.append((e.stat().st_mtime, e.path))
 
-        if valid_profiles:
-            return sorted(
-                valid_profiles, key=lambda p: os.path.getmtime(p), reverse=True
-            )
-        return []
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        return [Path(path) for _, path in entries]
 
-    def extract_groups(self, profile_path: Path) -> Dict[str, List[str]]:
-        """Reads sessionstore/recovery.jsonlz4 to find active Tab Groups."""
-        files = [
+    def source_files(self, profile_path: Path) -> List[Path]:
+        """Session files in the order extract_groups tries them."""
+        return [
             profile_path / "sessionstore-backups" / "recovery.jsonlz4",
             profile_path / "sessionstore-backups" / "previous.jsonlz4",
             profile_path / "sessionstore.jsonlz4",
         ]
 
+    def extract_groups(self, profile_path: Path) -> Dict[str, List[str]]:
+        """Reads sessionstore/recovery.jsonlz4 to find active Tab Groups."""
         json_data = None
-        for f in files:
+        for f in self.source_files(profile_path):
             json_data = self._safe_read_json(f)
             if json_data:
                 break
@@ -65,31 +72,28 @@ class FirefoxBrowser(BrowserBackend):
         if not json_data:
             return {}
 
-        organized_groups = {}
+        organized_groups = defaultdict(list)
         seen_video_ids = set()
 
         if "windows" not in json_data:
             return {}
 
         for window in json_data["windows"]:
-            group_metadata = {}
-            raw_groups = window.get("groups", [])
-
-            for g in raw_groups:
-                g_id = g.get("id")
-                g_title = g.get("title") or g.get("name") or "Untitled Group"
-                if g_id:
-                    group_metadata[g_id] = g_title
+            group_metadata = {
+                str(g["id"]): g.get("title") or g.get("name") or "Untitled Group"
+                for g in window.get("groups", ())
+                if g.get("id")
+            }
 
             if not group_metadata:
                 continue
 
             for tab in window.get("tabs", []):
                 group_id = tab.get("groupId")
-                if group_id:
-                    group_id = str(group_id)
-
-                if not group_id or group_id not in group_metadata:
+                if not group_id:
+                    continue
+                group_name = group_metadata.get(str(group_id))
+                if group_name is None:
                     continue
 
                 entries = tab.get("entries", [])
@@ -105,9 +109,6 @@ class FirefoxBrowser(BrowserBackend):
 
                         if vid_id and vid_id not in seen_video_ids:
                             seen_video_ids.add(vid_id)
-                            group_name = group_metadata[group_id]
-                            if group_name not in organized_groups:
-                                organized_groups[group_name] = []
                             organized_groups[group_name].append(url)
 
-        return organized_groups
+        return dict(organized_groups)
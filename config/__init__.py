@@ -1,6 +1,7 @@
 from .constants import (
     BASE_DIR,
     CLEANUP_PATTERNS,
+    CLEANUP_RE,
     LOG_FILE_BACKUP_COUNT,
     LOG_FILE_MAX_BYTES,
     LOG_ROTATION_MODE,
@@ -16,6 +17,7 @@ __all__ = [
     "AppConfig",
     "BASE_DIR",
     "CLEANUP_PATTERNS",
+    "CLEANUP_RE",
     "LOG_FILE_BACKUP_COUNT",
     "LOG_FILE_MAX_BYTES",
     "LOG_ROTATION_MODE",
@@ -11,6 +11,8 @@ class RuntimeSettings:
     """Mutable settings used during a run (e.g. quality menu toggle)."""
 
     allow_skip_fragments: bool = False
+    max_parallel_downloads: int = 4
+    concurrent_fragments: int = 4
 
 
 @dataclass
@@ -21,6 +23,8 @@ class AppConfig:
     default_quality: Optional[str] = None  # "1", "2", "3" or None
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
     allow_skip_fragments: bool = False
+    max_parallel_downloads: int = 4  # 1 = sequential; capped to avoid rate limits
+    concurrent_fragments: int = 4  # fragments fetched at once per video (DASH/HLS)
 
 
 _CONFIG_PATH = BASE_DIR / "config.json"
@@ -63,11 +67,25 @@ def load_config() -> AppConfig:
 
     allow_skip_fragments = bool(data.get("allow_skip_fragments", False))
 
+    max_parallel_downloads = defaults.max_parallel_downloads
+    try:
+        max_parallel_downloads = min(max(int(data["max_parallel_downloads"]), 1), 8)
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    concurrent_fragments = defaults.concurrent_fragments
+    try:
+        concurrent_fragments = min(max(int(data["concurrent_fragments"]), 1), 16)
+    except (KeyError, TypeError, ValueError):
+        pass
+
     _loaded = AppConfig(
         download_dir=download_dir,
         default_quality=default_quality,
         log_level=log_level,
         allow_skip_fragments=allow_skip_fragments,
+        max_parallel_downloads=max_parallel_downloads,
+        concurrent_fragments=concurrent_fragments,
     )
     return _loaded
 
@@ -1,7 +1,17 @@
-from .download import download_audio, get_deno_path, is_deno_installed, is_ffmpeg_installed, show_progress
-from .metadata import clean_tags, sanitize_text
+from .download import (
+    download_audio,
+    get_deno_path,
+    install_dns_cache,
+    is_deno_installed,
+    is_ffmpeg_installed,
+    reset_probes,
+    show_progress,
+)
+from .metadata import clean_tags, safe_folder_name, sanitize_text
 from .quality import ask_quality
 from .ui import (
+    MSG_CHROME_TIPS,
+    MSG_FFMPEG_MISSING,
     MSG_FILES_SAVED,
     MSG_INVALID_CHOICE,
     MSG_JOB_DONE,
@@ -11,6 +21,7 @@ from .ui import (
     SEP_LINE,
     SEP_THIN,
     clear_screen,
+    install_buffered_stdout,
     prompt,
     wait_enter,
 )
@@ -20,15 +31,21 @@ __all__ = [
     "clean_tags",
     "download_audio",
     "get_deno_path",
+    "install_dns_cache",
     "is_deno_installed",
     "is_ffmpeg_installed",
+    "reset_probes",
+    "safe_folder_name",
     "sanitize_text",
     "show_progress",
     "clear_screen",
+    "install_buffered_stdout",
     "SEP_LINE",
     "SEP_THIN",
     "prompt",
     "wait_enter",
+    "MSG_CHROME_TIPS",
+    "MSG_FFMPEG_MISSING",
     "MSG_NO_GROUPS",
     "MSG_SELECT_GROUP",
     "MSG_INVALID_CHOICE",
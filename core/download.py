@@ -1,31 +1,56 @@
 import os
+import re
+import socket
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import app_logging
 import yt_dlp
-from yt_dlp.utils import DownloadError
+from yt_dlp.utils import DownloadCancelled, DownloadError
 
 from app_logging import FatalForbiddenError, FragmentLogger
+from browsers.base import extract_video_id
 from config import QualityProfile, RuntimeSettings
 
-from .metadata import clean_tags, rename_from_tags
+from .metadata import clean_tags, rename_from_tags, safe_folder_name
 from .ui import MSG_ALL_FAILED, MSG_STRATEGY_FAILED, SEP_LINE
 
+# Parallel downloads share one progress line
+_STDOUT_LOCK = threading.Lock()
+# Set on Ctrl+C so downloads already running stop at their next progress tick
+_CANCEL = threading.Event()
 
+# Redraw a file's progress at most every _PROGRESS_INTERVAL s unless its percent changes.
+# Keyed by filename: parallel downloads must not throttle each other's updates.
+_PROGRESS_INTERVAL = 0.1
+_last_draw: Dict[str, Tuple[float, int]] = {}
+
+# Every possible bar state, so a redraw is a lookup instead of two string builds
+_BAR_LENGTH = 20
+_BARS = tuple("█" * i + "-" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+
+
+@lru_cache(maxsize=1)
 def is_ffmpeg_installed() -> bool:
     """Checks if FFmpeg is available in the system PATH."""
     import shutil
     return shutil.which("ffmpeg") is not None
 
 
+@lru_cache(maxsize=1)
 def is_deno_installed() -> bool:
     """Checks if Deno JavaScript runtime is available in the system PATH."""
     import shutil
     return shutil.which("deno") is not None
 
 
+@lru_cache(maxsize=1)
 def get_deno_path() -> Optional[str]:
     """Returns the path to Deno if available, None otherwise."""
     import shutil
@@ -39,35 +64,407 @@ def get_deno_path() -> Optional[str]:
     return None
 
 
+def install_dns_cache(maxsize: int = 256, ttl: float = 300.0) -> None:
+    """
+    Caches socket.getaddrinfo results for `ttl` seconds (LRU, at most `maxsize` hosts).
+    Every strategy/player_client attempt builds fresh YoutubeDL sessions that resolve the same hosts;
+    the TTL keeps long interactive sessions from pinning stale CDN addresses.
+    """
+    if getattr(socket.getaddrinfo, "_dns_cached", False):
+        return
+    resolve = socket.getaddrinfo
+    cache: "OrderedDict[Any, Tuple[float, list]]" = OrderedDict()
+    lock = threading.Lock()
+
+    def getaddrinfo(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with lock:
+            hit = cache.get(key)
+            if hit is not None and hit[0] > now:
+                cache.move_to_end(key)
+                # Hand out a copy so callers cannot mutate the cached result
+                return list(hit[1])
+        result = resolve(*args, **kwargs)
+        with lock:
+            cache[key] = (now + ttl, result)
+            cache.move_to_end(key)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+        return list(result)
+
+    getaddrinfo._dns_cached = True
+    socket.getaddrinfo = getaddrinfo
+
+
+def reset_probes() -> None:
+    """Forgets cached FFmpeg/Deno lookups (e.g. after installing one mid-session)."""
+    is_ffmpeg_installed.cache_clear()
+    is_deno_installed.cache_clear()
+    get_deno_path.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _raw_progress_fd() -> Optional[int]:
+    """
+    stdout's file descriptor when progress redraws can skip the text layer (POSIX terminal).
+    Windows consoles keep going through sys.stdout, which handles their code page.
+    """
+    if os.name == "nt" or sys.stdout is None:
+        return None
+    try:
+        if not sys.stdout.isatty():
+            return None
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
 def show_progress(d: Dict[str, Any]) -> None:
     """
     Custom hook to show a single-line progress bar.
     Prevents the terminal from scrolling/stacking endlessly.
     """
+    if _CANCEL.is_set():
+        raise DownloadCancelled()
+
     if d["status"] == "downloading":
         p = d.get("_percent_str", "0%").replace("%", "")
+        try:
+            percent = float(p)
+        except ValueError:
+            percent = None
+
+        whole_percent = int(percent) if percent is not None else -1
+        now = time.monotonic()
+        path = d.get("filename", "")
+        last_ts, last_percent = _last_draw.get(path, (0.0, -1))
+        if now - last_ts < _PROGRESS_INTERVAL and whole_percent == last_percent:
+            return
+        _last_draw[path] = (now, whole_percent)
+
         speed = d.get("_speed_str", "N/A")
         eta = d.get("_eta_str", "N/A")
-        filename = d.get("filename", "").split(os.sep)[-1]
+        filename = os.path.basename(path)
         if len(filename) > 30:
             filename = filename[:27] + "..."
-        try:
-            percent = float(p)
-            bar_length = 20
-            filled_length = int(bar_length * percent // 100)
-            bar = "█" * filled_length + "-" * (bar_length - filled_length)
-        except ValueError:
-            bar = "-" * 20
+        if percent is not None:
+            filled_length = int(_BAR_LENGTH * percent // 100)
+            bar = _BARS[max(0, min(_BAR_LENGTH, filled_length))]
+        else:
+            bar = _BARS[0]
             p = "??"
-        sys.stdout.write(
-            f"\r[DOWNLOADING] |{bar}| {p}% | {speed} | ETA: {eta} | {filename}    "
-        )
-        sys.stdout.flush()
+        line = f"\r[DOWNLOADING] |{bar}| {p}% | {speed} | ETA: {eta} | {filename}    "
+        fd = _raw_progress_fd()
+        with _STDOUT_LOCK:
+            if fd is not None:
+                # Anything print() left in the text buffer must reach the terminal first
+                sys.stdout.flush()
+                os.write(fd, line.encode(sys.stdout.encoding or "utf-8", "replace"))
+                return
+            sys.stdout.write(line)
+            # Only a terminal needs each redraw pushed out; redirected output stays buffered
+            if getattr(sys.stdout, "line_buffering", True):
+                sys.stdout.flush()
     elif d["status"] == "finished":
-        sys.stdout.write(
-            "\r[COMPLETE]    |" + "█" * 20 + "| 100% | Downloaded! Processing...                     "
+        _last_draw.pop(d.get("filename", ""), None)
+        with _STDOUT_LOCK:
+            sys.stdout.write(
+                "\r[COMPLETE]    |" + _BARS[_BAR_LENGTH] + "| 100% | Downloaded! Processing...                     "
+            )
+            sys.stdout.flush()
+
+
+def _print_locked(text: str) -> None:
+    """print() for worker threads: never interleaves with a progress redraw."""
+    with _STDOUT_LOCK:
+        print(text)
+
+
+def _load_browser_cookies(browser: str) -> Any:
+    """
+    Reads and decrypts a browser's cookie store once for all workers of a pass.
+    Raises FatalForbiddenError if the store is locked or cannot be decrypted.
+    """
+    from yt_dlp.cookies import load_cookies
+
+    try:
+        return load_cookies(None, (browser,), None)
+    except Exception as e:
+        app_logging.log.error("Could not load %s cookies: %s", browser, e)
+        raise FatalForbiddenError("Cookie Access Failed (Browser Open/Encrypted)")
+
+
+def _share_cookiejar(ydl: Any, cookiejar: Any) -> None:
+    """Hands a pre-loaded jar to a YoutubeDL before it would read cookiesfrombrowser itself."""
+    # yt-dlp loads YoutubeDL.cookiejar lazily (cached_property); seeding it skips the
+    # per-instance browser DB read. Versions without the lazy attribute load their own.
+    if isinstance(getattr(type(ydl), "cookiejar", None), cached_property):
+        ydl.__dict__["cookiejar"] = cookiejar
+
+
+def _download_one(
+    url: str,
+    ydl_opts: Dict[str, Any],
+    frag_logger: FragmentLogger,
+    quality_settings: QualityProfile,
+    can_try_next_config: bool,
+    cookiejar: Any = None,
+) -> Optional[Path]:
+    """
+    Downloads a single URL with its own YoutubeDL (instances are not thread-safe).
+    `cookiejar` is the pass's shared browser cookie jar, if the strategy uses cookies.
+    Returns the final file path, or None if this URL failed on its own.
+    Raises FatalForbiddenError when the whole strategy should be abandoned.
+    """
+    # YoutubeDL keeps (and writes into) the dict it is given as ydl.params; the caller's
+    # ydl_opts is shared by every worker of the pass, so this URL gets its own copy
+    opts = dict(ydl_opts)
+    try:
+        with yt_dlp.YoutubeDL(opts) as ydl:
+            if cookiejar is not None:
+                _share_cookiejar(ydl, cookiejar)
+            probed = None
+            try:
+                info = ydl.extract_info(url, download=False)
+                formats = info.get("formats", [])
+                has_real_formats = False
+                for fmt in formats:
+                    acodec = fmt.get("acodec", "none")
+                    vcodec = fmt.get("vcodec", "none")
+                    fmt_id = fmt.get("format_id", "")
+                    if fmt_id.startswith("sb"):
+                        continue
+                    if acodec != "none" or vcodec != "none":
+                        has_real_formats = True
+                        break
+                if not has_real_formats and formats:
+                    if frag_logger.signature_solving_failed or frag_logger.only_images_available:
+                        if can_try_next_config:
+                            raise FatalForbiddenError(
+                                "No Formats Available (Signature Solving Failed - Try Next Config)"
+                            )
+                        raise FatalForbiddenError(
+                            "No Formats Available (Signature Solving Failed)"
+                        )
+                    raise FatalForbiddenError(
+                        "No Formats Available (Video Restricted)"
+                    )
+                probed = info
+            except FatalForbiddenError:
+                raise
+            except Exception as e:
+                app_logging.log.debug(
+                    "Info extraction failed, trying download: %s", e
+                )
+
+            if probed is not None:
+                if (
+                    not quality_settings.convert
+                    and probed.get("ext") not in _THUMBNAIL_EMBED_EXTS
+                ):
+                    # EmbedThumbnail cannot use it (e.g. original webm); skip the write
+                    opts["writethumbnail"] = False
+                # Reuse the probe's extraction; only download + post-processing remain
+                info = ydl.process_ie_result(probed, download=True)
+            else:
+                info = ydl.extract_info(url, download=True)
+            filename = ydl.prepare_filename(info)
+
+        final_path = Path(filename)
+        if quality_settings.convert:
+            final_path = final_path.with_suffix(f".{quality_settings.codec}")
+        return final_path
+    except DownloadError as e:
+        kinds = {m.lastgroup for m in _DOWNLOAD_ERR_RE.finditer(str(e))}
+        if "forbidden" in kinds:
+            raise FatalForbiddenError("403 Forbidden (IP Block)")
+        if "format" in kinds:
+            if frag_logger.signature_solving_failed or frag_logger.only_images_available:
+                if can_try_next_config:
+                    raise FatalForbiddenError(
+                        "Format Unavailable (Signature Solving Failed - Try Next Config)"
+                    )
+                raise FatalForbiddenError(
+                    "Format Unavailable (Signature Solving Failed)"
+                )
+            raise FatalForbiddenError(
+                "Format Unavailable (Cookie Soft Ban)"
+            )
+        if "cookies" in kinds:
+            raise FatalForbiddenError(
+                "Cookie Access Failed (Browser Open/Encrypted)"
+            )
+        app_logging.log.error("Download failed for %s: %s", url, e)
+    except DownloadCancelled:
+        app_logging.log.info("Download cancelled: %s", url)
+    except PermissionError as e:
+        app_logging.log.error(
+            "Windows locked the file (Antivirus/FFmpeg race condition) for URL %s: %s",
+            url,
+            e,
+        )
+        _print_locked("\n  File locked (e.g. by antivirus). Skipping this URL.")
+    except FatalForbiddenError:
+        raise
+    except Exception as e:
+        app_logging.log.error(
+            "Failed to process %s: %s", url, e, exc_info=True
+        )
+        _print_locked("\n  Skipped due to error: {}".format(e))
+    return None
+
+
+# Initial read/write block for non-fragmented streams (yt-dlp's default is 1 KiB)
+_DOWNLOAD_BUFFER_SIZE = 64 * 1024
+
+# DownloadError classes handled in _download_one; one scan finds every kind a message mentions
+_DOWNLOAD_ERR_RE = re.compile(
+    r"(?P<forbidden>403|Forbidden)"
+    r"|(?P<format>Requested format is not available)"
+    r"|(?P<cookies>Failed to decrypt|database is locked)"
+)
+
+# Containers yt-dlp's EmbedThumbnail can write cover art into
+_THUMBNAIL_EMBED_EXTS = frozenset(
+    ("mp3", "mkv", "mka", "ogg", "opus", "flac", "m4a", "mp4", "m4v", "mov")
+)
+
+# yt-dlp format selector by (converting to MP3 with FFmpeg, using browser cookies)
+_FORMAT_TABLE = {
+    (True, True): "bestaudio/bestvideo+bestaudio/bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best",
+    (True, False): "bestaudio/bestvideo+bestaudio/best",
+    (False, True): "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best",
+    (False, False): "bestaudio[ext=m4a]/bestaudio/best",
+}
+
+
+def _base_ydl_opts(
+    download_path: Path,
+    frag_logger: FragmentLogger,
+    quality_settings: QualityProfile,
+    settings: RuntimeSettings,
+    has_ffmpeg: bool,
+) -> Dict[str, Any]:
+    """
+    yt-dlp options shared by every strategy/player_client attempt of one group.
+    Per-attempt keys (extractor_args, format, cookiesfrombrowser) are set by the caller.
+    """
+    ydl_opts: Dict[str, Any] = {
+        "outtmpl": str(download_path / "%(title)s.%(ext)s"),
+        "restrictfilenames": False,
+        "windowsfilenames": True,
+        "overwrites": True,
+        "force_overwrites": True,
+        "verbose": False,
+        "quiet": False,
+        "logger": frag_logger,
+        "progress_hooks": [show_progress],
+        "socket_timeout": 30,
+        "retries": 15,
+        "fragment_retries": 15,
+        "concurrent_fragment_downloads": settings.concurrent_fragments,
+        "buffersize": _DOWNLOAD_BUFFER_SIZE,
+        "keepfragments": False,
+        "skip_unavailable_fragments": settings.allow_skip_fragments,
+        "writethumbnail": False,
+        "noplaylist": True,
+        "parse_metadata": [
+            ":(?P<meta_synopsis>)",
+            ":(?P<meta_description>)",
+            ":(?P<meta_comment>)",
+            ":(?P<meta_purl>)",
+            ":(?P<meta_encoder>)",
+            ":(?P<meta_copyright>)",
+        ],
+        "postprocessors": [],
+        "postprocessor_args": {},
+    }
+
+    deno_path = get_deno_path()
+    if deno_path and not is_deno_installed():
+        ydl_opts["js_runtimes"] = {"deno": {"path": deno_path}}
+        app_logging.log.debug(
+            "Using Deno for signature solving (custom path): %s", deno_path
+        )
+    elif is_deno_installed():
+        app_logging.log.debug(
+            "Using Deno for signature solving (auto-detected from PATH)"
+        )
+    else:
+        app_logging.log.debug(
+            "Deno not found - signature solving may fail"
+        )
+
+    if not has_ffmpeg:
+        app_logging.log.info("FFmpeg not detected. Downloading raw audio only.")
+        return ydl_opts
+
+    ydl_opts["writethumbnail"] = True
+    ydl_opts["postprocessor_args"] = {
+        "FFmpegExtractAudio": ["-bitexact", "-map_metadata", "-1"],
+        "FFmpegMetadata": ["-id3v2_version", "3", "-write_id3v1", "0"],
+        "EmbedThumbnail": ["-map_metadata", "-1"],
+    }
+    ydl_opts["postprocessors"] = [
+        {"key": "SponsorBlock"},
+        {
+            "key": "ModifyChapters",
+            "remove_sponsor_segments": [
+                "sponsor",
+                "intro",
+                "outro",
+                "selfpromo",
+                "interaction",
+                "music_offtopic",
+            ],
+        },
+        {"key": "EmbedThumbnail"},
+        {"key": "FFmpegMetadata", "add_metadata": True},
+    ]
+    if quality_settings.convert:
+        ydl_opts["postprocessors"].insert(
+            0,
+            {
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": quality_settings.codec,
+                "preferredquality": "0",
+            },
         )
-        sys.stdout.flush()
+    return ydl_opts
+
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """Drops URLs pointing at a video already listed (keeps the first occurrence)."""
+    seen: Set[str] = set()
+    unique = []
+    for url in urls:
+        key = extract_video_id(url) or url
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(url)
+    return unique
+
+
+def _snapshot(path: Path) -> Set[str]:
+    """Names of the entries in a folder (no per-entry Path objects or stat calls)."""
+    with os.scandir(path) as it:
+        return {entry.name for entry in it}
+
+
+def _post_process_one(file_path: Path, index: int, total: int) -> Path:
+    """Cleans tags and renames one downloaded file; safe to run on a worker thread."""
+    if not file_path.exists():
+        return file_path
+    app_logging.log.info(
+        "[PROCESSING] Item %d/%d: %s...    ",
+        index + 1,
+        total,
+        file_path.name,
+    )
+    tags = clean_tags(file_path)
+    return rename_from_tags(file_path, index=index, tags=tags)
 
 
 def download_audio(
@@ -80,7 +477,17 @@ def download_audio(
     """
     Orchestrates the download process using yt-dlp.
     Handles filename generation, conversions, and metadata post-processing.
+    "success" in the returned stats is 0 when every browser strategy failed.
     """
+    unique_urls = _dedupe_urls(urls)
+    if len(unique_urls) != len(urls):
+        app_logging.log.info(
+            "Skipping %d duplicate URL(s) in group '%s'",
+            len(urls) - len(unique_urls),
+            group_name,
+        )
+    urls = unique_urls
+
     app_logging.log.info(
         "Starting download for group '%s' with %d URL(s). Quality: %s (convert=%s, codec=%s)",
         group_name,
@@ -90,13 +497,12 @@ def download_audio(
         quality_settings.codec,
     )
 
-    safe_name = "".join(
-        [c for c in group_name if c.isalpha() or c.isdigit() or c == " "]
-    ).strip()
+    _CANCEL.clear()
+    safe_name = safe_folder_name(group_name)
     download_path = download_base / safe_name
     download_path.mkdir(parents=True, exist_ok=True)
 
-    files_before = set(download_path.glob("*"))
+    files_before = _snapshot(download_path)
     frag_logger = FragmentLogger()
     has_ffmpeg = is_ffmpeg_installed()
     browser_strategies = [None, "firefox", "chrome"]
@@ -106,6 +512,11 @@ def download_audio(
         ["ios"],
     ]
 
+    base_opts = _base_ydl_opts(
+        download_path, frag_logger, quality_settings, settings, has_ffmpeg
+    )
+    convert = has_ffmpeg and quality_settings.convert
+
     success = False
     downloaded_files: List[Path] = []
     remaining_urls = urls.copy()
@@ -124,9 +535,11 @@ def download_audio(
 
         use_cookies = bool(current_browser)
         player_client_idx = 0
-        succeeded_in_this_pass: List[str] = []
+        succeeded_in_this_pass: Set[str] = set()
 
         try:
+            # One cookie DB read per pass; per-URL loads would hit the locked DB/keychain in parallel
+            cookiejar = _load_browser_cookies(current_browser) if current_browser else None
             while player_client_idx < len(player_client_configs) if use_cookies else 1:
                 frag_logger.signature_solving_failed = False
                 frag_logger.only_images_available = False
@@ -136,208 +549,73 @@ def download_audio(
                 else:
                     player_clients = ["default", "-web_safari"]
 
-                ydl_opts = {
-                    "outtmpl": str(download_path / "%(title)s.%(ext)s"),
-                    "restrictfilenames": False,
-                    "windowsfilenames": True,
-                    "overwrites": True,
-                    "force_overwrites": True,
-                    "verbose": False,
-                    "quiet": False,
-                    "logger": frag_logger,
-                    "progress_hooks": [show_progress],
-                    "socket_timeout": 30,
-                    "retries": 15,
-                    "fragment_retries": 15,
-                    "keepfragments": False,
-                    "skip_unavailable_fragments": settings.allow_skip_fragments,
-                    "writethumbnail": False,
-                    "noplaylist": True,
-                    "extractor_args": {
-                        "youtube": {"player_client": player_clients}
-                    },
-                    "parse_metadata": [
-                        ":(?P<meta_synopsis>)",
-                        ":(?P<meta_description>)",
-                        ":(?P<meta_comment>)",
-                        ":(?P<meta_purl>)",
-                        ":(?P<meta_encoder>)",
-                        ":(?P<meta_copyright>)",
-                    ],
-                    "postprocessors": [],
-                    "postprocessor_args": {},
-                }
-
-                deno_path = get_deno_path()
-                if deno_path and not is_deno_installed():
-                    ydl_opts["js_runtimes"] = {"deno": {"path": deno_path}}
-                    app_logging.log.debug(
-                        "Using Deno for signature solving (custom path): %s", deno_path
-                    )
-                elif is_deno_installed():
-                    app_logging.log.debug(
-                        "Using Deno for signature solving (auto-detected from PATH)"
-                    )
-                else:
-                    app_logging.log.debug(
-                        "Deno not found - signature solving may fail"
-                    )
-
+                ydl_opts = base_opts.copy()
+                ydl_opts["extractor_args"] = {"youtube": {"player_client": player_clients}}
+                ydl_opts["format"] = _FORMAT_TABLE[(convert, use_cookies)]
                 if current_browser:
                     ydl_opts["cookiesfrombrowser"] = (current_browser,)
-                else:
-                    ydl_opts.pop("cookiesfrombrowser", None)
-
-                if has_ffmpeg:
-                    ydl_opts["writethumbnail"] = True
-                    ydl_opts["postprocessor_args"] = {
-                        "FFmpegExtractAudio": ["-bitexact", "-map_metadata", "-1"],
-                        "FFmpegMetadata": ["-id3v2_version", "3", "-write_id3v1", "0"],
-                        "EmbedThumbnail": ["-map_metadata", "-1"],
-                    }
-                    ydl_opts["postprocessors"] = [
-                        {"key": "SponsorBlock"},
-                        {
-                            "key": "ModifyChapters",
-                            "remove_sponsor_segments": [
-                                "sponsor",
-                                "intro",
-                                "outro",
-                                "selfpromo",
-                                "interaction",
-                                "music_offtopic",
-                            ],
-                        },
-                        {"key": "EmbedThumbnail"},
-                        {"key": "FFmpegMetadata", "add_metadata": True},
-                    ]
-                    if quality_settings.convert:
-                        if use_cookies:
-                            ydl_opts["format"] = (
-                                "bestaudio/bestvideo+bestaudio/"
-                                "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best"
-                            )
-                        else:
-                            ydl_opts["format"] = "bestaudio/bestvideo+bestaudio/best"
-                        ydl_opts["postprocessors"].insert(
-                            0,
-                            {
-                                "key": "FFmpegExtractAudio",
-                                "preferredcodec": quality_settings.codec,
-                                "preferredquality": "0",
-                            },
-                        )
-                    else:
-                        if use_cookies:
-                            ydl_opts["format"] = (
-                                "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best"
-                            )
-                        else:
-                            ydl_opts["format"] = "bestaudio[ext=m4a]/bestaudio/best"
-                else:
-                    app_logging.log.info("FFmpeg not detected. Downloading raw audio only.")
-                    ydl_opts["format"] = (
-                        "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio/best"
-                        if use_cookies
-                        else "bestaudio[ext=m4a]/bestaudio/best"
-                    )
 
                 try:
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        for url in remaining_urls:
-                            if url in succeeded_in_this_pass:
-                                continue
+                    can_try_next_config = (
+                        use_cookies and player_client_idx < len(player_client_configs) - 1
+                    )
+                    pending = [u for u in remaining_urls if u not in succeeded_in_this_pass]
+                    workers = max(1, min(settings.max_parallel_downloads, len(pending)))
+                    fatal_error: Optional[FatalForbiddenError] = None
+
+                    executor = ThreadPoolExecutor(max_workers=workers)
+                    futures: Dict[Future, str] = {}
+                    try:
+                        for url in pending:
+                            future = executor.submit(
+                                _download_one,
+                                url,
+                                ydl_opts,
+                                frag_logger,
+                                quality_settings,
+                                can_try_next_config,
+                                cookiejar,
+                            )
+                            futures[future] = url
+                        for future in as_completed(futures):
+                            url = futures[future]
                             try:
-                                try:
-                                    info = ydl.extract_info(url, download=False)
-                                    formats = info.get("formats", [])
-                                    has_real_formats = False
-                                    for fmt in formats:
-                                        acodec = fmt.get("acodec", "none")
-                                        vcodec = fmt.get("vcodec", "none")
-                                        fmt_id = fmt.get("format_id", "")
-                                        if fmt_id.startswith("sb"):
-                                            continue
-                                        if acodec != "none" or vcodec != "none":
-                                            has_real_formats = True
-                                            break
-                                    if not has_real_formats and formats:
-                                        if frag_logger.signature_solving_failed or frag_logger.only_images_available:
-                                            if use_cookies and player_client_idx < len(player_client_configs) - 1:
-                                                app_logging.log.info(
-                                                    "No formats available with player_client %s, trying next configuration...",
-                                                    player_clients,
-                                                )
-                                                raise FatalForbiddenError(
-                                                    "No Formats Available (Signature Solving Failed - Try Next Config)"
-                                                )
-                                            raise FatalForbiddenError(
-                                                "No Formats Available (Signature Solving Failed)"
-                                            )
-                                        raise FatalForbiddenError(
-                                            "No Formats Available (Video Restricted)"
-                                        )
-                                except FatalForbiddenError:
-                                    raise
-                                except Exception as e:
-                                    app_logging.log.debug(
-                                        "Info extraction failed, trying download: %s", e
-                                    )
-
-                                info = ydl.extract_info(url, download=True)
-                                filename = ydl.prepare_filename(info)
-                                final_path = Path(filename)
-                                if quality_settings.convert:
-                                    final_path = final_path.with_suffix(
-                                        f".{quality_settings.codec}"
-                                    )
-                                succeeded_in_this_pass.append(url)
-                                downloaded_files.append(final_path)
-                                app_logging.log.info(
-                                    "[SUCCESS] Downloaded '%s' via %s (player_client: %s)",
-                                    final_path.name,
-                                    browser_name.upper(),
-                                    player_clients,
-                                )
-                            except DownloadError as e:
-                                err_msg = str(e)
-                                if "403" in err_msg or "Forbidden" in err_msg:
-                                    raise FatalForbiddenError("403 Forbidden (IP Block)")
-                                if "Requested format is not available" in err_msg:
-                                    if frag_logger.signature_solving_failed or frag_logger.only_images_available:
-                                        if use_cookies and player_client_idx < len(player_client_configs) - 1:
-                                            app_logging.log.info(
-                                                "Format unavailable with player_client %s, trying next configuration...",
-                                                player_clients,
-                                            )
-                                            raise FatalForbiddenError(
-                                                "Format Unavailable (Signature Solving Failed - Try Next Config)"
-                                            )
-                                        raise FatalForbiddenError(
-                                            "Format Unavailable (Signature Solving Failed)"
-                                        )
-                                    raise FatalForbiddenError(
-                                        "Format Unavailable (Cookie Soft Ban)"
-                                    )
-                                if "Failed to decrypt" in err_msg or "database is locked" in err_msg:
-                                    raise FatalForbiddenError(
-                                        "Cookie Access Failed (Browser Open/Encrypted)"
-                                    )
-                                app_logging.log.error("Download failed for %s: %s", url, e)
-                            except PermissionError as e:
-                                app_logging.log.error(
-                                    "Windows locked the file (Antivirus/FFmpeg race condition) for URL %s: %s",
-                                    url,
-                                    e,
-                                )
-                                print("\n  File locked (e.g. by antivirus). Skipping this URL.")
-                            except FatalForbiddenError:
-                                raise
-                            except Exception as e:
-                                app_logging.log.error(
-                                    "Failed to process %s: %s", url, e, exc_info=True
-                                )
-                                print("\n  Skipped due to error: {}".format(e))
+                                final_path = future.result()
+                            except FatalForbiddenError as e:
+                                # Abandon the pass: drop queued URLs, let running ones finish
+                                if fatal_error is None:
+                                    fatal_error = e
+                                    for f in futures:
+                                        f.cancel()
+                                continue
+                            except CancelledError:
+                                continue
+                            if final_path is None:
+                                continue
+                            succeeded_in_this_pass.add(url)
+                            downloaded_files.append(final_path)
+                            app_logging.log.info(
+                                "[SUCCESS] Downloaded '%s' via %s (player_client: %s)",
+                                final_path.name,
+                                browser_name.upper(),
+                                player_clients,
+                            )
+                    except BaseException:
+                        # Ctrl+C: drop the queued URLs and stop the running ones
+                        _CANCEL.set()
+                        for f in futures:
+                            f.cancel()
+                        executor.shutdown(wait=False)
+                        raise
+                    executor.shutdown()
+
+                    if fatal_error is not None:
+                        if "Try Next Config" in str(fatal_error):
+                            app_logging.log.info(
+                                "No usable formats with player_client %s, trying next configuration...",
+                                player_clients,
+                            )
+                        raise fatal_error
 
                     if succeeded_in_this_pass:
                         success = True
@@ -408,9 +686,8 @@ def download_audio(
             )
             break
 
-        for url in succeeded_in_this_pass:
-            if url in remaining_urls:
-                remaining_urls.remove(url)
+        if succeeded_in_this_pass:
+            remaining_urls = [u for u in remaining_urls if u not in succeeded_in_this_pass]
 
     if not success:
         app_logging.log.warning(
@@ -425,23 +702,23 @@ def download_audio(
         print(SEP_LINE)
         app_logging.log.info("[POST-PROCESSING] Cleaning tags and renaming files...")
         total = len(downloaded_files)
-        for i, file_path in enumerate(downloaded_files):
-            if not file_path.exists():
-                continue
-            app_logging.log.info(
-                "[PROCESSING] Item %d/%d: %s...    ",
-                i + 1,
-                total,
-                file_path.name,
-            )
-            sys.stdout.flush()
-            clean_tags(file_path)
-            file_path = rename_from_tags(file_path, index=i)
+        workers = max(1, min(8, os.cpu_count() or 4, total))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_post_process_one, file_path, i, total)
+                for i, file_path in enumerate(downloaded_files)
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    app_logging.log.error("[POST-PROCESSING] Failed: %s", e)
 
-    files_after = set(download_path.glob("*"))
+    files_after = _snapshot(download_path)
     new_files_count = len(files_after - files_before)
 
     return {
+        "success": int(success),
         "new_files": new_files_count,
         "skipped_fragments": frag_logger.skipped,
         "warnings": frag_logger.warnings,
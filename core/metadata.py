@@ -1,10 +1,12 @@
 import os
 import re
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Tuple, Type
+from typing import Dict, Optional, Tuple, Type
 
 import app_logging
-from config import CLEANUP_PATTERNS
+from config import CLEANUP_RE
 
 _INVALID_WIN_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 _UPLOADER_HINTS = re.compile(
@@ -16,16 +18,48 @@ _CHANNEL_SUFFIX_PATTERNS = [
     re.compile(r"\s+official\s+channel\s*$", re.IGNORECASE),
     re.compile(r"\s+официальный\s*$", re.IGNORECASE),
 ]
+_RENAME_LOCK = threading.Lock()
+_TRAIL_SEP_RE = re.compile(r"\s*[-|]\s*$")
+_WS_RE = re.compile(r"\s+")
+# Gap bounded so long digit-free descriptions full of ©/℗ cannot make the search quadratic
+_YEAR_RE = re.compile(
+    r"(?:℗|©|\(c\)|released\s*on|published\s*on|provided\s*to\s*youtube)[^0-9]{0,200}((?:19|20)\d{2})",
+    re.IGNORECASE,
+)
 
+# ID3 frames stripped by clean_tags (track number, v2.4 dates, ffmpeg/yt-dlp leftovers, comments)
+_BLACKLIST_START = ("TRCK", "TDRC", "TDAT", "TSSE", "TENC", "COMM", "USLT")
+_BLACKLIST_TXXX = (
+    "description",
+    "synopsis",
+    "purl",
+    "comment",
+    "producers",
+    "handler",
+    "major_brand",
+    "minor_version",
+    "compatible_brands",
+)
+# All TXXX needles in one alternation: a single scan per description instead of one per word
+_BLACKLIST_TXXX_RE = re.compile("|".join(map(re.escape, _BLACKLIST_TXXX)), re.IGNORECASE)
 
-def _tag_frame_types() -> Dict[str, Type]:
-    from mutagen.id3 import TALB, TIT2, TPE1, TPE2
 
+@lru_cache(maxsize=1)
+def _id3():
+    """mutagen.id3, imported on first use and bound once for the post-processing loop."""
+    from mutagen import id3
+
+    return id3
+
+
+@lru_cache(maxsize=1)
+def _tag_frame_types() -> Dict[str, Type]:
+    id3 = _id3()
     return {
-        "TIT2": TIT2,
-        "TPE1": TPE1,
-        "TPE2": TPE2,
-        "TALB": TALB,
+        "TIT2": id3.TIT2,
+        "TPE1": id3.TPE1,
+        "TPE2": id3.TPE2,
+        "TALB": id3.TALB,
     }
 
 
@@ -34,19 +68,36 @@ def sanitize_text(text: str) -> str:
     if not text:
         return ""
 
-    clean_text = text
-    for pattern in CLEANUP_PATTERNS:
-        clean_text = pattern.sub("", clean_text)
+    clean_text = CLEANUP_RE.sub("", text)
 
     # Remove trailing separators often left behind (e.g., "Song - " -> "Song")
-    clean_text = re.sub(r"\s*[-|]\s*$", "", clean_text)
-    clean_text = re.sub(r"\s+", " ", clean_text).strip()
+    clean_text = _TRAIL_SEP_RE.sub("", clean_text)
+    clean_text = _WS_RE.sub(" ", clean_text).strip()
     if ".." in clean_text:
         clean_text = clean_text.replace("..", ".")
 
     return clean_text
 
 
+class _FolderNameTable(dict):
+    """str.translate table keeping letters, digits and spaces; filled lazily per code point."""
+
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        keep = char.isalpha() or char.isdigit() or char == " "
+        self[code] = code if keep else None
+        return self[code]
+
+
+_FOLDER_NAME_TABLE = _FolderNameTable()
+
+
+@lru_cache(maxsize=256)
+def safe_folder_name(text: str) -> str:
+    """Keep only letters, digits and spaces (group name -> download folder)."""
+    return text.translate(_FOLDER_NAME_TABLE).strip()
+
+
 def safe_filename_stem(text: str) -> str:
     """Strip characters invalid on Windows filenames."""
     if not text:
@@ -149,13 +200,14 @@ def artist_title_stem(artist: str, title: str) -> str:
 
 
 def _read_id3_artist_title(filepath: Path) -> Tuple[str, str]:
-    from mutagen.id3 import ID3
-
     try:
-        audio = ID3(filepath)
+        audio = _id3().ID3(filepath)
     except Exception:
         return "", ""
+    return _artist_title_of(audio)
+
 
+def _artist_title_of(audio) -> Tuple[str, str]:
     artist = ""
     title = ""
     if "TPE1" in audio:
@@ -169,10 +221,12 @@ def _read_id3_artist_title(filepath: Path) -> Tuple[str, str]:
 
 def _apply_rename(filepath: Path, stem: str, index: int) -> Path:
     new_path = filepath.parent / f"{stem}{filepath.suffix}"
-    if new_path.exists() and new_path.resolve() != filepath.resolve():
-        new_path = filepath.parent / f"{stem}_{index}{filepath.suffix}"
     try:
-        os.rename(filepath, new_path)
+        # Post-processing runs in parallel: check-and-rename must not interleave
+        with _RENAME_LOCK:
+            if new_path.exists() and new_path.resolve() != filepath.resolve():
+                new_path = filepath.parent / f"{stem}_{index}{filepath.suffix}"
+            os.rename(filepath, new_path)
         app_logging.log.info("[RENAME] '%s' -> '%s'", filepath.name, new_path.name)
         return new_path
     except OSError as e:
@@ -180,12 +234,19 @@ def _apply_rename(filepath: Path, stem: str, index: int) -> Path:
         return filepath
 
 
-def rename_from_tags(filepath: Path, index: int = 0) -> Path:
-    """Rename MP3 to 'Artist - Title' when both ID3 tags are present."""
-    if not filepath.exists() or filepath.suffix.lower() != ".mp3":
-        return filepath
-
-    artist, title = _read_id3_artist_title(filepath)
+def rename_from_tags(
+    filepath: Path, index: int = 0, tags: Optional[Tuple[str, str]] = None
+) -> Path:
+    """
+    Rename MP3 to 'Artist - Title' when both ID3 tags are present.
+    `tags` is the (artist, title) pair returned by clean_tags; passing it skips re-reading the file.
+    """
+    if tags is None:
+        if not filepath.exists() or filepath.suffix.lower() != ".mp3":
+            return filepath
+        artist, title = _read_id3_artist_title(filepath)
+    else:
+        artist, title = tags
     if not artist or not title:
         clean_stem = safe_filename_stem(sanitize_text(filepath.stem))
         if clean_stem and clean_stem != filepath.stem:
@@ -199,8 +260,17 @@ def rename_from_tags(filepath: Path, index: int = 0) -> Path:
     return _apply_rename(filepath, target_stem, index)
 
 
-def _sanitize_id3_text_frames(audio) -> None:
-    """Apply sanitize_text to common ID3 text tags (title, artist, album)."""
+def _keep_padding(info) -> int:
+    """
+    mutagen padding callback: reuse the space freed by dropped frames as padding.
+    The tag is then rewritten in place instead of shifting the whole audio stream.
+    """
+    return max(info.padding, 0)
+
+
+def _sanitize_id3_text_frames(audio) -> bool:
+    """Apply sanitize_text to common ID3 text tags (title, artist, album). Returns True if any changed."""
+    changed = False
     for key, frame_cls in _tag_frame_types().items():
         if key not in audio:
             continue
@@ -209,103 +279,95 @@ def _sanitize_id3_text_frames(audio) -> None:
         if not new_text or new_text == original:
             continue
         audio.add(frame_cls(encoding=3, text=new_text))
+        changed = True
         app_logging.log.info(
             "[METADATA] Cleaned %s: '%s' -> '%s'", key, original, new_text
         )
+    return changed
 
 
-def clean_tags(filepath: Path) -> None:
+def _find_release_year(audio, keys) -> Optional[str]:
+    """First release year mentioned in description/comment frames (e.g. '℗ 1998')."""
+    for key in keys:
+        if not (key.startswith("TXXX:description") or key.startswith("COMM")):
+            continue
+        for text in audio[key].text:
+            match = _YEAR_RE.search(text)
+            if match:
+                return match.group(1)
+    return None
+
+
+def clean_tags(filepath: Path) -> Optional[Tuple[str, str]]:
     """
     Metadata cleaning for MP3s using Mutagen.
     Removes proprietary ffmpeg tags (TSSE, TENC) and comments (TXXX).
     Standardizes Year (TYER), cleans title/artist/album tags, removes TRCK.
+    Returns the final (artist, title) for rename_from_tags, or None if the file was not processed.
     """
-    from mutagen.id3 import ID3, TYER
-
-    if not filepath.exists():
-        return
+    id3 = _id3()
 
     if filepath.suffix.lower() != ".mp3":
-        return
+        return None
 
     try:
-        audio = ID3(filepath)
+        audio = id3.ID3(filepath)
+        # Only rewrite the file when a tag changes or it is not ID3v2.3 yet
+        dirty = audio.version != (2, 3, 0)
         found_year = None
+        keys = list(audio.keys())
 
         if "TDRC" in audio:
             found_year = str(audio["TDRC"].text[0])[:4]
         elif "TYER" in audio:
             found_year = str(audio["TYER"].text[0])[:4]
 
-        search_text = ""
-        for key in audio.keys():
-            if key.startswith("TXXX:description") or key.startswith("COMM"):
-                search_text += str(audio[key]) + "\n"
+        description_year = _find_release_year(audio, keys)
+        if description_year:
+            found_year = description_year
 
-        if search_text:
-            pattern = r"(?:℗|©|\(c\)|released\s*on|published\s*on|provided\s*to\s*youtube)[^0-9]*((?:19|20)\d{2})"
-            match = re.search(pattern, search_text, re.IGNORECASE)
-            if match:
-                found_year = match.group(1)
+        # One pass over the keys snapshot; each key is unique, so no re-check is needed
+        for key in keys:
+            if key.startswith(_BLACKLIST_START) or (
+                key.startswith("TXXX")
+                and _BLACKLIST_TXXX_RE.search(audio[key].desc)
+            ):
+                del audio[key]
+                dirty = True
 
-        tags_to_remove = []
+        if found_year and ("TYER" not in audio or str(audio["TYER"]) != found_year):
+            audio.add(id3.TYER(encoding=3, text=found_year))
+            dirty = True
 
-        if "TRCK" in audio:
-            del audio["TRCK"]
-        if "TDRC" in audio:
-            del audio["TDRC"]
-        if "TDAT" in audio:
-            del audio["TDAT"]
-
-        blacklist_start = ("TSSE", "TENC", "COMM", "USLT", "TDAT")
-        blacklist_txxx = [
-            "description",
-            "synopsis",
-            "purl",
-            "comment",
-            "producers",
-            "handler",
-            "major_brand",
-            "minor_version",
-            "compatible_brands",
-        ]
-
-        for key in list(audio.keys()):
-            if key.startswith(blacklist_start):
-                tags_to_remove.append(key)
-                continue
-            if key.startswith("TXXX"):
-                desc = audio[key].desc.lower()
-                if any(b in desc for b in blacklist_txxx):
-                    tags_to_remove.append(key)
-
-        for tag in tags_to_remove:
-            if tag in audio:
-                del audio[tag]
-
-        if found_year:
-            audio.add(TYER(encoding=3, text=found_year))
-
-        _sanitize_id3_text_frames(audio)
-
-        from mutagen.id3 import TIT2, TPE1
+        if _sanitize_id3_text_frames(audio):
+            dirty = True
 
         tag_artist = str(audio["TPE1"].text[0]) if "TPE1" in audio else ""
         tag_title = str(audio["TIT2"].text[0]) if "TIT2" in audio else ""
         resolved_artist, resolved_title = resolve_artist_title(tag_artist, tag_title)
         if resolved_artist and resolved_artist != tag_artist:
-            audio.add(TPE1(encoding=3, text=resolved_artist))
+            audio.add(id3.TPE1(encoding=3, text=resolved_artist))
+            dirty = True
             app_logging.log.info(
                 "[METADATA] Artist '%s' -> '%s'", tag_artist, resolved_artist
             )
         if resolved_title and resolved_title != tag_title:
-            audio.add(TIT2(encoding=3, text=resolved_title))
+            audio.add(id3.TIT2(encoding=3, text=resolved_title))
+            dirty = True
             app_logging.log.info(
                 "[METADATA] Title '%s' -> '%s'", tag_title, resolved_title
             )
 
-        audio.save(v1=0, v2_version=3)
+        if not dirty:
+            app_logging.log.debug("[CLEANER] Tags already clean: %s", filepath.name)
+            return _artist_title_of(audio)
+
+        audio.save(v1=0, v2_version=3, padding=_keep_padding)
         app_logging.log.info("[CLEANER] Sanitized tags: %s", filepath.name)
+        return _artist_title_of(audio)
 
     except Exception as e:
-        app_logging.log.error("[CLEANER] Failed on %s: %s", filepath.name, e)
+        # No upfront exists() stat: a vanished file is only detected on failure
+        if filepath.exists():
+            app_logging.log.error("[CLEANER] Failed on %s: %s", filepath.name, e)
+        return None
@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from typing import Optional
 
 import app_logging
@@ -16,6 +17,18 @@ from .ui import (
 )
 
 
+@lru_cache(maxsize=2)
+def _menu_lines(ffmpeg_available: bool) -> str:
+    """Quality option lines; built once per FFmpeg state and reused on every redraw."""
+    lines = []
+    for key, val in config.QUALITY_OPTIONS.items():
+        if not ffmpeg_available and val.convert:
+            lines.append("    [{}] {}  (requires FFmpeg)".format(key, val.name))
+        else:
+            lines.append("    [{}] {}  —  {}".format(key, val.name, val.desc))
+    return "\n".join(lines)
+
+
 def ask_quality(settings: RuntimeSettings) -> Optional[QualityProfile]:
     """CLI menu for selecting audio quality. Toggles settings.allow_skip_fragments on [S]."""
     ffmpeg_available = is_ffmpeg_installed()
@@ -26,11 +39,7 @@ def ask_quality(settings: RuntimeSettings) -> Optional[QualityProfile]:
     while True:
         clear_screen()
         print("\n  --- Audio quality ---\n")
-        for key, val in config.QUALITY_OPTIONS.items():
-            if not ffmpeg_available and val.convert:
-                print("    [{}] {}  (requires FFmpeg)".format(key, val.name))
-            else:
-                print("    [{}] {}  —  {}".format(key, val.name, val.desc))
+        print(_menu_lines(ffmpeg_available))
 
         skip_status = (
             "on (may skip bad fragments)"
@@ -1,4 +1,7 @@
+import io
 import os
+import sys
+from functools import lru_cache
 
 # Layout
 SEP_LINE = "=" * 50
@@ -6,9 +9,66 @@ SEP_THIN = "-" * 40
 TITLE_BORDER = "=" * 50
 
 
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+
+@lru_cache(maxsize=1)
+def _ansi_supported() -> bool:
+    """True if ANSI escapes work on stdout; on Windows turns on VT processing once."""
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(
+            kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+        )
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _stdout_is_tty() -> bool:
+    try:
+        return sys.stdout is not None and sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
 def clear_screen() -> None:
-    """Clears the terminal screen (cross-platform)."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Clears the terminal screen (cross-platform). No-op when output is redirected."""
+    if not _stdout_is_tty():
+        return
+    if _ansi_supported():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system("cls" if os.name == "nt" else "clear")
+
+
+def install_buffered_stdout() -> None:
+    """Gives redirected stdout (file/pipe) a 128 KiB buffer; terminals are left as is."""
+    stream = sys.stdout
+    if stream is None or stream.isatty():
+        return
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return
+    stream.flush()
+    sys.stdout = open(
+        fd,
+        "w",
+        buffering=128 * 1024,
+        encoding=stream.encoding,
+        errors=stream.errors,
+        closefd=False,
+    )
 
 
 # Prompts
@@ -26,6 +86,11 @@ def wait_enter(message: str = "Press Enter to continue") -> None:
 
 # Messages (user-facing)
 MSG_NO_GROUPS = "No YouTube links found in this profile."
+MSG_CHROME_TIPS = (
+    "\n  Tips for Chrome:\n"
+    "    • Right-click tabs → \"Add tabs to new group\".\n"
+    "    • Ctrl+Shift+D bookmarks all open tabs into a folder."
+)
 MSG_SELECT_GROUP = "Enter group number, or use a key below."
 MSG_INVALID_CHOICE = "Invalid choice. Try again."
 MSG_JOB_DONE = "Job complete."
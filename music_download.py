@@ -1,22 +1,32 @@
 """Entry point: CLI and orchestration only."""
 
+import argparse
+import re
 import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import app_logging
 import config
 from app_logging import init as init_logging
-from browsers import ChromeBrowser, FirefoxBrowser
-from config import get_config, RuntimeSettings
+from browsers import BrowserBackend, ChromeBrowser, FirefoxBrowser, extract_all
+from config import AppConfig, get_config, RuntimeSettings
 from core import (
     download_audio,
     get_deno_path,
+    install_buffered_stdout,
+    install_dns_cache,
     is_deno_installed,
+    is_ffmpeg_installed,
     ask_quality,
     clear_screen,
     SEP_LINE,
     SEP_THIN,
     wait_enter,
     prompt,
+    safe_folder_name,
+    MSG_CHROME_TIPS,
+    MSG_FFMPEG_MISSING,
     MSG_NO_GROUPS,
     MSG_SELECT_GROUP,
     MSG_INVALID_CHOICE,
@@ -25,70 +35,215 @@ from core import (
     MSG_FILES_SAVED,
 )
 
-
-def main() -> None:
+_YT_LINK = re.compile(r"youtu(?:\.be|be\.com)").search
+
+# (backend, profile) -> (source fingerprint, groups); menu redraws reuse unchanged profiles
+_GROUPS_CACHE: Dict[Tuple[str, Path], Tuple[Optional[tuple], Dict[str, List[str]]]] = {}
+
+
+def _cached_groups(
+    backend: BrowserBackend, profile: Path, fingerprint: Optional[tuple]
+) -> Optional[Dict[str, List[str]]]:
+    cached = _GROUPS_CACHE.get((backend.name, profile))
+    if cached is None or fingerprint is None or cached[0] != fingerprint:
+        return None
+    return cached[1]
+
+
+def _load_groups(
+    backend: BrowserBackend, profile: Path, refresh: bool = False
+) -> Dict[str, List[str]]:
+    """extract_groups, skipped while the profile's session/bookmark files are unchanged."""
+    fingerprint = backend.source_fingerprint(profile)
+    if not refresh:
+        groups = _cached_groups(backend, profile, fingerprint)
+        if groups is not None:
+            return groups
+    app_logging.log.info("Reading data for profile '%s' at path '%s'", profile.name, profile)
+    groups = backend.extract_groups(profile)
+    _GROUPS_CACHE[(backend.name, profile)] = (fingerprint, groups)
+    return groups
+
+
+def _report_download(group: str, stats: Dict[str, int], download_dir: Path) -> None:
+    """Logs and prints the outcome of download_audio for one group."""
+    new_files = stats.get("new_files", 0)
+    warnings = stats.get("warnings", 0)
+    skipped = stats.get("skipped_fragments", 0)
     app_logging.log.info(
+        "Download finished for group '%s'. New files: %d, skipped fragments: %d, warnings: %d",
+        group,
+        new_files,
+        skipped,
+        warnings,
+    )
+
+    save_path = download_dir / (safe_folder_name(group) or "downloads")
+    print("\n  " + MSG_FILES_SAVED.format(path=save_path))
+    print("  Downloaded {} file(s).".format(new_files))
+    if warnings or skipped:
+        print("  ({} warning(s), {} skipped fragment(s))".format(warnings, skipped))
+    print("\n  " + MSG_JOB_DONE)
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Download YouTube tab groups/bookmark folders as audio.",
+        epilog="With --browser and --group the menus are skipped (non-interactive run).",
+    )
+    parser.add_argument("--browser", choices=("firefox", "chrome"), help="Browser to read")
+    parser.add_argument("--profile", help="Profile folder name (default: most recently used)")
+    parser.add_argument("--group", help="Tab group or bookmark folder name")
+    parser.add_argument(
+        "--quality",
+        choices=tuple(config.QUALITY_OPTIONS),
+        help="Quality preset key (default: default_quality from config.json, else 1)",
+    )
+    args = parser.parse_args(argv)
+    if bool(args.browser) != bool(args.group):
+        parser.error("--browser and --group must be given together")
+    if (args.profile or args.quality) and not args.browser:
+        parser.error("--profile and --quality only apply with --browser and --group")
+    return args
+
+
+def _run_batch(
+    args: argparse.Namespace,
+    browsers: List[BrowserBackend],
+    app_cfg: AppConfig,
+    settings: RuntimeSettings,
+) -> int:
+    """Downloads one group named on the command line without any menus. Returns an exit code."""
+    log = app_logging.log
+    backend = next(b for b in browsers if args.browser in b.name.lower())
+    profiles = backend.get_profiles()
+    if args.profile:
+        profiles = [p for p in profiles if p.name == args.profile]
+    if not profiles:
+        log.error("No matching %s profile (requested: %s)", backend.name, args.profile)
+        print(MSG_NO_PROFILES)
+        return 1
+
+    profile = profiles[0]
+    log.info("Batch run: %s profile '%s', group '%s'", backend.name, profile.name, args.group)
+    links = list(filter(_YT_LINK, backend.extract_groups(profile).get(args.group, [])))
+    if not links:
+        log.error("Group '%s' has no YouTube links in profile '%s'", args.group, profile.name)
+        print(MSG_NO_GROUPS)
+        return 1
+
+    quality = config.QUALITY_OPTIONS[args.quality or app_cfg.default_quality or "1"]
+    if quality.convert and not is_ffmpeg_installed():
+        log.error("FFmpeg is missing! Cannot convert to %s.", quality.codec)
+        print(MSG_FFMPEG_MISSING)
+        return 1
+
+    stats = download_audio(links, args.group, quality, settings, app_cfg.download_dir)
+    _report_download(args.group, stats, app_cfg.download_dir)
+    if not stats.get("success") and not stats.get("new_files"):
+        log.error("Batch run for group '%s' downloaded nothing", args.group)
+        return 1
+    return 0
+
+
+def main(args: Optional[argparse.Namespace] = None) -> None:
+    log = app_logging.log
+    log.info(
         "Music Downloader started. Base directory: %s", config.BASE_DIR
     )
 
     if is_deno_installed():
         deno_path = get_deno_path()
-        app_logging.log.info(
+        log.info(
             "Deno JavaScript runtime detected: %s", deno_path or "PATH"
         )
     else:
-        app_logging.log.warning(
+        log.warning(
             "Deno JavaScript runtime not found. YouTube signature solving may fail. "
             "Install Deno: Run windows\\install_deno.bat or visit https://deno.land"
         )
 
     try:
         browsers = [FirefoxBrowser(), ChromeBrowser()]
-        app_logging.log.info(
+        log.info(
             "Detected browser backends: %s", ", ".join(b.name for b in browsers)
         )
 
         app_cfg = get_config()
-        settings = RuntimeSettings(allow_skip_fragments=app_cfg.allow_skip_fragments)
+        settings = RuntimeSettings(
+            allow_skip_fragments=app_cfg.allow_skip_fragments,
+            max_parallel_downloads=app_cfg.max_parallel_downloads,
+            concurrent_fragments=app_cfg.concurrent_fragments,
+        )
 
+        if args is not None and args.browser and args.group:
+            sys.exit(_run_batch(args, browsers, app_cfg, settings))
+
+        # Browsers are fixed for the session, so the menu is rendered once
+        browser_menu = "\n".join(
+            [
+                SEP_LINE,
+                "     UNIVERSAL TAB GROUP DOWNLOADER       ",
+                SEP_LINE,
+                "\n  Select browser (sources for tabs/bookmarks):\n",
+            ]
+            + [f"    [{i + 1}] {b.name}" for i, b in enumerate(browsers)]
+            + ["    [q] Quit"]
+        )
+
+        browser_hint = "1–{}, q".format(len(browsers))
+
+        # Invalid input changes nothing on screen: re-prompt instead of clearing and redrawing
+        redraw = True
         while True:
-            clear_screen()
-            print(SEP_LINE)
-            print("     UNIVERSAL TAB GROUP DOWNLOADER       ")
-            print(SEP_LINE)
-            print("\n  Select browser (sources for tabs/bookmarks):\n")
-            for i, b in enumerate(browsers):
-                print(f"    [{i + 1}] {b.name}")
-            print("    [q] Quit")
-
-            choice = prompt("Choice", "1–{}, q".format(len(browsers)))
+            if redraw:
+                clear_screen()
+                print(browser_menu)
+            redraw = True
+
+            choice = prompt("Choice", browser_hint)
             if choice == "q":
                 sys.exit()
 
-            backend = None
-            try:
-                if choice.isdigit():
-                    backend = browsers[int(choice) - 1]
-                else:
-                    continue
-            except (ValueError, IndexError):
+            if not choice.isdecimal():
+                redraw = False
+                continue
+            if not 1 <= (idx := int(choice)) <= len(browsers):
                 print("\n  " + MSG_INVALID_CHOICE)
-                wait_enter()
+                redraw = False
                 continue
+            backend = browsers[idx - 1]
 
-            app_logging.log.info("User selected browser backend: %s", backend.name)
+            log.info("User selected browser backend: %s", backend.name)
             profiles = backend.get_profiles()
 
             if not profiles:
-                app_logging.log.warning(
+                log.warning(
                     "No profiles found for backend: %s", backend.name
                 )
                 print("\n  " + MSG_NO_PROFILES)
                 wait_enter()
                 continue
 
+            print("\n  Reading tabs and bookmarks...")
+            fingerprints = {p: backend.source_fingerprint(p) for p in profiles}
+            stale = [
+                p for p in profiles if _cached_groups(backend, p, fingerprints[p]) is None
+            ]
+            if stale:
+                log.info(
+                    "Reading data for %d %s profile(s)", len(stale), backend.name
+                )
+            for (_, profile), groups in extract_all((backend, p) for p in stale).items():
+                _GROUPS_CACHE[(backend.name, profile)] = (fingerprints[profile], groups)
+
+            no_groups_footer = (
+                "  [r] Refresh   [p] Switch profile ({})   [b] Back   [q] Quit".format(len(profiles))
+            )
             current_profile_idx = 0
             back_to_browser_menu = False
+            force_refresh = False
+            shown_groups = None
 
             while True:
                 if back_to_browser_menu:
@@ -96,45 +251,70 @@ def main() -> None:
 
                 selected_profile = profiles[current_profile_idx]
 
+                redraw = True
                 while True:
-                    clear_screen()
-                    print(SEP_LINE)
-                    print("  {}  —  {}".format(backend.name, selected_profile.name))
-                    print(SEP_THIN)
-                    print("  Reading tabs and bookmarks...")
-
-                    app_logging.log.info(
-                        "Reading data for profile '%s' at path '%s'",
-                        selected_profile.name,
-                        selected_profile,
-                    )
-                    groups = backend.extract_groups(selected_profile)
+                    if redraw:
+                        clear_screen()
+                        print(
+                            "\n".join(
+                                [
+                                    SEP_LINE,
+                                    "  {}  —  {}".format(backend.name, selected_profile.name),
+                                    SEP_THIN,
+                                    "  Reading tabs and bookmarks...",
+                                ]
+                            )
+                        )
 
-                    valid_groups = {}
-                    for name, links in groups.items():
-                        yt_links = [
-                            u for u in links if "youtube.com" in u or "youtu.be" in u
-                        ]
-                        if yt_links:
-                            valid_groups[name] = yt_links
+                        groups = _load_groups(backend, selected_profile, refresh=force_refresh)
+                        force_refresh = False
 
-                    if not valid_groups:
-                        app_logging.log.info(
-                            "No valid YouTube groups found for profile '%s' (%s)",
-                            selected_profile.name,
-                            backend.name,
-                        )
-                        print("\n  " + MSG_NO_GROUPS)
+                        # Cache hits return the same dict; only re-filter when it was re-read
+                        if groups is not shown_groups:
+                            shown_groups = groups
+                            filtered = (
+                                (name, list(filter(_YT_LINK, links)))
+                                for name, links in groups.items()
+                            )
+                            valid_groups = {name: links for name, links in filtered if links}
+                            group_names = tuple(valid_groups)
+                            group_hint = "1–{}, r, p, b, q".format(len(group_names))
+                            # Rendered once per groups object; redraws reuse the text
+                            lines = ["\n  Found {} group(s):\n".format(len(group_names))]
+                            for i, (name, links) in enumerate(valid_groups.items()):
+                                lines.append("    [{}] {}  ({} video{})".format(
+                                    i + 1, name, len(links), "s" if len(links) != 1 else ""
+                                ))
+                            lines.append(SEP_THIN)
+                            lines.append("  " + MSG_SELECT_GROUP)
+                            lines.append("  [r] Refresh   [p] Switch profile   [b] Back   [q] Quit")
+                            group_menu = "\n".join(lines)
+
+                        if valid_groups:
+                            log.info(
+                                "Found %d group(s)/folder(s) for profile '%s'.",
+                                len(group_names),
+                                selected_profile.name,
+                            )
+                            # One write per redraw instead of a print (and TTY flush) per line
+                            print(group_menu)
+                        else:
+                            log.info(
+                                "No valid YouTube groups found for profile '%s' (%s)",
+                                selected_profile.name,
+                                backend.name,
+                            )
+                            print("\n  " + MSG_NO_GROUPS)
 
-                        if backend.name == "Google Chrome":
-                            print("\n  Tips for Chrome:")
-                            print("    • Right-click tabs → \"Add tabs to new group\".")
-                            print("    • Ctrl+Shift+D bookmarks all open tabs into a folder.")
-                            print("    • Current profile: " + selected_profile.name)
+                            if backend.name == "Google Chrome":
+                                print(MSG_CHROME_TIPS)
+                                print("    • Current profile: " + selected_profile.name)
 
-                        print(SEP_THIN)
-                        print("  [r] Refresh   [p] Switch profile ({})   [b] Back   [q] Quit".format(len(profiles)))
+                            print(SEP_THIN)
+                            print(no_groups_footer)
+                    redraw = True
 
+                    if not valid_groups:
                         choice_input = prompt("Choice", "r, p, b, q")
                         if choice_input == "q":
                             sys.exit()
@@ -147,28 +327,13 @@ def main() -> None:
                             )
                             break
                         if choice_input == "r":
+                            force_refresh = True
                             continue
 
+                        redraw = False
                         continue
 
-                    group_names = list(valid_groups.keys())
-                    app_logging.log.info(
-                        "Found %d group(s)/folder(s) for profile '%s'.",
-                        len(group_names),
-                        selected_profile.name,
-                    )
-                    print("\n  Found {} group(s):\n".format(len(group_names)))
-                    for i, name in enumerate(group_names):
-                        print("    [{}] {}  ({} video{})".format(
-                            i + 1, name, len(valid_groups[name]),
-                            "s" if len(valid_groups[name]) != 1 else ""
-                        ))
-
-                    print(SEP_THIN)
-                    print("  " + MSG_SELECT_GROUP)
-                    print("  [r] Refresh   [p] Switch profile   [b] Back   [q] Quit")
-
-                    choice_input = prompt("Choice", "1–{}, r, p, b, q".format(len(group_names)))
+                    choice_input = prompt("Choice", group_hint)
                     if choice_input == "q":
                         sys.exit()
                     if choice_input == "b":
@@ -178,25 +343,28 @@ def main() -> None:
                         current_profile_idx = (current_profile_idx + 1) % len(profiles)
                         break
                     if choice_input == "r":
+                        force_refresh = True
                         continue
 
-                    try:
-                        target_group = group_names[int(choice_input) - 1]
-                        app_logging.log.info(
-                            "User selected group '%s' containing %d link(s).",
-                            target_group,
-                            len(valid_groups[target_group]),
-                        )
-                    except (ValueError, IndexError):
+                    if not (
+                        choice_input.isdecimal()
+                        and 1 <= (idx := int(choice_input)) <= len(group_names)
+                    ):
                         print("\n  " + MSG_INVALID_CHOICE)
-                        wait_enter()
+                        redraw = False
                         continue
+                    target_group = group_names[idx - 1]
+                    log.info(
+                        "User selected group '%s' containing %d link(s).",
+                        target_group,
+                        len(valid_groups[target_group]),
+                    )
 
                     quality = ask_quality(settings)
                     if quality is None:
                         continue
 
-                    app_logging.log.info(
+                    log.info(
                         "User selected Quality: %s (Convert: %s)",
                         quality.name,
                         quality.convert,
@@ -209,39 +377,21 @@ def main() -> None:
                         settings,
                         app_cfg.download_dir,
                     )
-
-                    app_logging.log.info(
-                        "Download finished for group '%s'. New files: %d, skipped fragments: %d, warnings: %d",
-                        target_group,
-                        stats.get("new_files", 0),
-                        stats.get("skipped_fragments", 0),
-                        stats.get("warnings", 0),
-                    )
-
-                    new_files = stats.get("new_files", 0)
-                    warnings = stats.get("warnings", 0)
-                    skipped = stats.get("skipped_fragments", 0)
-                    safe_name = "".join(
-                        c for c in target_group if c.isalpha() or c.isdigit() or c == " "
-                    ).strip()
-                    save_path = app_cfg.download_dir / (safe_name or "downloads")
-
-                    print("\n  " + MSG_FILES_SAVED.format(path=save_path))
-                    print("  Downloaded {} file(s).".format(new_files))
-                    if warnings or skipped:
-                        print("  ({} warning(s), {} skipped fragment(s))".format(warnings, skipped))
-                    print("\n  " + MSG_JOB_DONE)
+                    _report_download(target_group, stats, app_cfg.download_dir)
                     wait_enter()
 
     except KeyboardInterrupt:
-        app_logging.log.info("Execution interrupted by user via KeyboardInterrupt.")
+        log.info("Execution interrupted by user via KeyboardInterrupt.")
         sys.exit(0)
 
 
 if __name__ == "__main__":
+    cli_args = _parse_args()
+    install_buffered_stdout()
+    install_dns_cache()
     init_logging(config.BASE_DIR)
     try:
-        main()
+        main(cli_args)
     except Exception as e:
         app_logging.log.exception("Unhandled exception in Music Downloader: %s", e)
         sys.exit(1)